@@ -24,6 +24,7 @@ import pytest
 
 from unittests.config.utils import load_config, template
 from yaecs import Configuration, Experiment, Priority, assign_order, assign_yaml_tag
+from yaecs.config.config_processing_functions import match_params_with_cache
 from yaecs.user_utils import make_config
 from yaecs.yaecs_utils import compare_string_pattern
 
@@ -104,6 +105,71 @@ def test_get(caplog):
     assert config.get("param.param", None) is None
 
 
+def test_has_parameter(yaml_default):
+    config = make_config(yaml_default, do_not_merge_command_line=True, overwriting_regime="unsafe")
+    assert config.has_parameter("subconfig1.param2")
+    assert config.subconfig1.has_parameter("param1")
+    assert not config.has_parameter("new_param")
+    assert not config.has_parameter("subconfig1.new_param")
+    assert config.match_params("param1", "new_param", "subconfig1.new_param") == ["param1"]
+    assert config.match_params("subconfig1.*") == ["subconfig1.param2"]
+
+    config.new_param = 1
+    config.subconfig1.new_param = 2
+    assert config.has_parameter("new_param")
+    assert config.has_parameter("subconfig1.new_param")
+    assert config.subconfig1.has_parameter("subconfig1.new_param")
+    assert config.match_params("param1", "new_param", "subconfig1.new_param") == [
+        "param1", "new_param", "subconfig1.new_param"]
+    assert config.match_params("subconfig1.*") == ["subconfig1.param2", "subconfig1.new_param"]
+    assert config.subconfig1.match_params("new_param") == ["new_param"]
+
+    config_copy = config.copy()
+    assert config_copy.has_parameter("subconfig1.new_param")
+    config_copy.other_param = 3
+    config_copy.subconfig1.other_param = 4
+    assert config_copy.has_parameter("other_param")
+    assert config_copy.match_params("subconfig1.*") == ["subconfig1.param2", "subconfig1.new_param",
+                                                        "subconfig1.other_param"]
+    assert not config.has_parameter("other_param")
+    assert not config.has_parameter("subconfig1.other_param")
+    assert config.match_params("subconfig1.*") == ["subconfig1.param2", "subconfig1.new_param"]
+
+    config.subconfig1 = 5
+    assert config.has_parameter("subconfig1")
+    assert not config.has_parameter("subconfig1.param2")
+    assert config.match_params("subconfig1.param2", "subconfig1.*") == []
+    del config.new_param
+    assert not config.has_parameter("new_param")
+    assert config.match_params("new_param") == []
+
+
+def test_replace_sub_config(yaml_default):
+    config = make_config(yaml_default, do_not_merge_command_line=True, overwriting_regime="unsafe",
+                         additional_configs_suffix="_path")
+    assert [sub_config.get_name() for sub_config in config.get_sub_configs()] == [
+        "subconfig1", "subconfig2", "subconfig3"]
+    config.subconfig2 = 5
+    assert [sub_config.get_name() for sub_config in config.get_sub_configs()] == ["subconfig1"]
+    assert config.get_parameter_names() == ["param1", "subconfig1", "subconfig2", "def_second_path",
+                                            "exp_second_path", "subconfig1.param2"]
+    del config.subconfig1
+    assert config.get_sub_configs() == []
+    assert config.get_parameter_names() == ["param1", "subconfig2", "def_second_path", "exp_second_path"]
+
+
+def test_match_params_with_cache(yaml_default):
+    config = make_config(yaml_default, do_not_merge_command_line=True, overwriting_regime="unsafe")
+    matches = {}
+    assert match_params_with_cache(config, "subconfig1.*", matches) == ["subconfig1.param2"]
+    assert match_params_with_cache(config, "subconfig1.*", matches) == ["subconfig1.param2"]
+    config.subconfig1.new_param = 1
+    assert match_params_with_cache(config, "subconfig1.*", matches) == ["subconfig1.param2", "subconfig1.new_param"]
+    config.subconfig1 = 5
+    assert match_params_with_cache(config, "subconfig1.*", matches) == []
+    assert match_params_with_cache(config, "subconfig1", matches) == ["subconfig1"]
+
+
 def test_get_dict(yaml_default):
     config = load_config(default_config=yaml_default)
     object.__setattr__(config, "___save", "test")
@@ -415,6 +481,32 @@ def test_pre_processing(capsys, tmp_file_name,
             yaml_no_file_call_processing_while_loading_nested[1])
 
 
+def test_check_param_in_list():
+    class ModeConfig(Configuration):
+        @staticmethod
+        def get_default_config_path():
+            return {"mode": "train"}
+
+        def parameters_pre_processing(self):
+            return {"mode": self.check_param_in_list(["Train", "test"])}
+
+        def parameters_post_processing(self):
+            return {}
+
+    config = ModeConfig.load_config({"mode": "TEST"}, do_not_merge_command_line=True)
+    assert config.mode == "TEST"
+    with pytest.raises(ValueError, match=r"Valid choices are \['Train', 'test'\]"):
+        config.merge({"mode": "infer"})
+
+
+def test_hook_in_sub_config(tmpdir):
+    with open(tmpdir / "hook_in_sub_config.yaml", "w", encoding="utf-8") as fil:
+        fil.write(f"subconfig:\n  path: !experiment_path {tmpdir / 'experiment'}\n")
+    config = make_config(str(tmpdir / "hook_in_sub_config.yaml"), do_not_merge_command_line=True)
+    assert config.get_hook("experiment_path") == ["subconfig.path"]
+    assert config.get_experiment_path() == str(tmpdir / "experiment_0")
+
+
 def test_post_processing(capsys, yaml_default, yaml_experiment, tmp_file_name,
                          yaml_default_preproc_default_dot_param):
     # Does post-processing work after load_config ?
@@ -79,16 +79,20 @@ class Configuration(_ConfigurationBase):
         self._main_config = self if main_config is None else main_config
         self._methods = [name for name in dir(self)
                          if name not in ["_operating_creation_or_merging", "_main_config", "_state"]]
-        self._configuration_variations = []
-        self._configuration_variations_names = []
+        self._method_names_set = frozenset(self._methods)
+        self._tagged_methods_info = None
+        self._configuration_variations = {}
+        self._configuration_variations_names = {}
         self._grids = []
         self._name = name
         self._nesting_hierarchy = ([] if nesting_hierarchy is None else list(nesting_hierarchy))
-        self._variation_name = (variation if main_config is None else main_config.get_variation_name())
+        self._is_main = not self._nesting_hierarchy
+        self._set_variation_name_attribute(variation if main_config is None else main_config.get_variation_name())
         self._verbose = verbose
         kwargs = {"do_not_pre_process": do_not_pre_process, "do_not_post_process": do_not_post_process, **kwargs}
         super().__init__(**kwargs)
-        self._protected_attributes = list(self.__dict__) + ["_protected_attributes"]
+        self._protected_attributes = list(self.__dict__) + ["_protected_attributes", "_ignored_attributes"]
+        self._ignored_attributes = frozenset(self._protected_attributes + ["config_metadata"])
 
         # Set config metadata
         self.config_metadata = {
@@ -244,17 +248,13 @@ class Configuration(_ConfigurationBase):
         if self._variation_name is not None:
             return [self]  # if this config is already a variation, it should not create further variations
 
-        variations_names_to_use = [i[0] for i in self._configuration_variations]
-        variations_names_to_use_changing = [i[0] for i in self._configuration_variations]
-        variations_to_use = [i[1] for i in self._configuration_variations]
-        variations_to_use_changing = [i[1] for i in self._configuration_variations]
+        variations_names_to_use_changing = list(self._configuration_variations)
+        variations_to_use_changing = list(self._configuration_variations.values())
         variations = []
         variations_names = []
 
         def _add_new_names(new_names, dim, var_ind: int):
-            for vari_name in self._configuration_variations_names:
-                if vari_name[0] == dim:
-                    new_names.append(names_to_add[var_ind] + "+" + vari_name[0] + "_" + vari_name[1][index])
+            new_names.append(names_to_add[var_ind] + "+" + dim + "_" + self._configuration_variations_names[dim][index])
             return new_names
 
         # Adding grids
@@ -262,7 +262,7 @@ class Configuration(_ConfigurationBase):
             grid_to_add = []
             names_to_add = []
             for dimension in grid:
-                if dimension not in variations_names_to_use:
+                if dimension not in self._configuration_variations:
                     raise TypeError(f"Grid element '{dimension}' is an empty list or "
                                     "not a registered variation configuration.")
                 if dimension in variations_names_to_use_changing:
@@ -270,18 +270,15 @@ class Configuration(_ConfigurationBase):
                     variations_names_to_use_changing.pop(index)
                     variations_to_use_changing.pop(index)
                 if not grid_to_add:
-                    grid_to_add = [[i] for i in variations_to_use[variations_names_to_use.index(dimension)]]
-                    for var_name in self._configuration_variations_names:
-                        if var_name[0] == dimension:
-                            names_to_add = [var_name[0] + "_" + i for i in var_name[1]]
+                    grid_to_add = [[i] for i in self._configuration_variations[dimension]]
+                    names_to_add = [dimension + "_" + i for i in self._configuration_variations_names[dimension]]
                 else:
                     new_grid_to_add = []
                     new_names_to_add = []
+                    dimension_variations = self._configuration_variations[dimension]
                     for var_index, current_variation in enumerate(grid_to_add):
-                        for index in range(len(variations_to_use[variations_names_to_use.index(dimension)])):
-                            new_grid_to_add.append(
-                                current_variation
-                                + [variations_to_use[variations_names_to_use.index(dimension)][index]])
+                        for index, dimension_variation in enumerate(dimension_variations):
+                            new_grid_to_add.append(current_variation + [dimension_variation])
                             new_names_to_add = _add_new_names(new_names_to_add, dimension, var_index)
                     grid_to_add = [list(var) for var in new_grid_to_add]
                     names_to_add = list(new_names_to_add)
@@ -293,9 +290,7 @@ class Configuration(_ConfigurationBase):
             for variation_index, variation in enumerate(remaining_variations):
                 variations.append([variation])
                 name = variations_names_to_use_changing[var_idx]
-                for var_name in self._configuration_variations_names:
-                    if var_name[0] == name:
-                        variations_names.append(name + "_" + var_name[1][variation_index])
+                variations_names.append(name + "_" + self._configuration_variations_names[name][variation_index])
 
         # Creating configs
         if not variations:
@@ -369,10 +364,10 @@ class Configuration(_ConfigurationBase):
         :param name: index to set the variation index with
         :param deep: whether to also recursively set the variation name of all sub-configs
         """
-        object.__setattr__(self, "_variation_name", name)
+        self._set_variation_name_attribute(name)
         if deep:
             for subconfig in self.get_sub_configs(deep=True):
-                object.__setattr__(subconfig, "_variation_name", name)
+                subconfig._set_variation_name_attribute(name)  # pylint: disable=protected-access
 
     @classmethod
     def _get_instance(cls, name: str = "main", overwriting_regime: str = "auto-save",
@@ -21,7 +21,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import yaml
 
@@ -39,6 +39,7 @@ if TYPE_CHECKING:
     from .config import Configuration
 
 YAECS_LOGGER = logging.getLogger(__name__)
+PROCESSING_SOURCES = (("pre", "parameters_pre_processing"), ("post", "parameters_post_processing"))
 
 
 class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixin, ConfigConvenienceMixin,
@@ -51,8 +52,9 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
     parameters_pre_processing: Callable[[], Dict[str, Callable]]
     parameters_post_processing: Callable[[], Dict[str, Callable]]
     _get_instance: Callable
-    _get_tagged_methods_info: Callable[[], List[Tuple[Union[str, Callable]]]]
+    _get_tagged_methods_info: Callable[[], Dict[str, Dict[str, Any]]]
     _main_config: 'Configuration'
+    _method_names_set: FrozenSet[str]
     _methods: List[str]
     _nesting_hierarchy: List[str]
     _operating_creation_or_merging: bool
@@ -75,13 +77,15 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
         # PROTECTED ATTRIBUTES
         if self._is_main_config():
             self._modified_buffer = []
-            self._setter = Setter(registered_methods=self._get_tagged_methods_info(),
+            self._setter = Setter(registered_methods=dict(self._get_tagged_methods_info()),
                                   do_not_post_process=do_not_post_process, do_not_pre_process=do_not_pre_process,
                                   verbose=self._verbose)
-            for process_type in ["pre", "post"]:
-                source = f"parameters_{process_type}_processing"
+            for process_type, source in PROCESSING_SOURCES:
                 self._setter.bulk_add_processors(processors=getattr(self, source)(),
                                                  processing_type=process_type, source=source, container=self)
+        self._all_full_paths = None
+        self._structure_version = 0
+        self._sub_configs_cache = None
         self._former_saving_time = None
         self._from_argv = from_argv
         self._pre_postprocessing_values = {}
@@ -92,19 +96,23 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
 
     def __getitem__(self, item) -> Any:
         if "." in item and "*" not in item:
-            sub_config_name = ("___"
-                               + item.split(".")[0] if item.split(".")[0] in self._methods else item.split(".")[0])
+            first, _, rest = item.partition(".")
+            sub_config_name = "___" + first if first in self._method_names_set else first
             sub_config = getattr(self, sub_config_name)
             if not isinstance(sub_config, _ConfigurationBase):
                 did_you_mean_message = self._did_you_mean(sub_config_name, filter_type=self.__class__)
                 raise TypeError(f"As the parameter '{sub_config_name}' is not a sub-config"
                                 f", it cannot be accessed.\n{did_you_mean_message}")
-            return sub_config[item.split(".", 1)[1]]
-        return getattr(self, "___" + item if item in self._methods else item)
+            return sub_config[rest]
+        return getattr(self, "___" + item if item in self._method_names_set else item)
 
     def __setattr__(self, key, value) -> None:
         if (self.is_in_operation() or self._main_config.is_in_operation()
                 or self.config_metadata["overwriting_regime"] == "unsafe"):
+            if "_ignored_attributes" in self.__dict__ and (
+                    key not in self.__dict__ or isinstance(value, _ConfigurationBase)
+                    or isinstance(self.__dict__[key], _ConfigurationBase)):
+                self._reset_parameter_names_cache()
             object.__setattr__(self, key, value)
         elif self.config_metadata["overwriting_regime"] == "auto-save":
             self._manual_merge({key: value}, source='code')
@@ -114,6 +122,11 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
             raise ValueError(f"No behaviour determined for value '{self.config_metadata['overwriting_regime']}' of "
                              "parameter 'overwriting_regime'.")
 
+    def __delattr__(self, key) -> None:
+        if "_ignored_attributes" in self.__dict__ and key not in self._ignored_attributes:
+            self._reset_parameter_names_cache()
+        object.__delattr__(self, key)
+
     def __getattribute__(self, item) -> Any:
         try:
             return object.__getattribute__(self, item)
@@ -345,7 +358,7 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
             return
 
         name = key.split('.')[0]
-        attribute_name = "___" + name if name in self._methods else name
+        attribute_name = "___" + name if name in self._method_names_set else name
         try:
             old_value = getattr(self, attribute_name)
         except AttributeError as exception:
@@ -379,7 +392,7 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
             raise ValueError(f"The '*' character is not authorised in the default config ({key}).")
 
         name = key.split('.')[0]
-        attribute_name = "___" + name if name in self._methods else name
+        attribute_name = "___" + name if name in self._method_names_set else name
 
         if "." in key:
             try:
@@ -401,6 +414,7 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
                     self._set_sub_config(name, attribute_name, {k: value[k] for k in value.get_parameter_names(False)})
                 else:
                     self._set_parameter(name, attribute_name, value)
+                    self._reset_parameter_names_cache()
 
     def _set_parameter(self, name: str, attribute_name: str, value: Any, old_value: Any = NoValue()) -> None:
         """ Method called by _add_item and _merge_item to set a parameter in the config to a new value. Ultimately
@@ -433,8 +447,17 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
             verbose=self._verbose
         )
         object.__setattr__(self, attribute_name, sub_config)
+        self._reset_parameter_names_cache()
         return sub_config
 
+    def _reset_parameter_names_cache(self) -> None:
+        """ Method called whenever a parameter or a sub-config is added to the config, to invalidate the set of all
+        full paths cached by the main config and bump its structure version. """
+        main_config = self._main_config
+        object.__setattr__(main_config, "_all_full_paths", None)
+        # pylint: disable-next=protected-access
+        object.__setattr__(main_config, "_structure_version", main_config._structure_version + 1)
+
     def _gather_command_line_dict(self, to_merge: Optional[Union[List[str], str]] = None) -> Dict[str, Any]:
         """ Method called automatically at the end of each constructor to gather all parameters from the command line
         into a dictionary. This dictionary is then merged. """
@@ -491,12 +514,15 @@ class _ConfigurationBase(ConfigHooksMixin, ConfigGettersMixin, ConfigSettersMixi
         its former value in memory for saving purposes. """
         modified = [self.get_modified_buffer().pop(0) for _ in range(len(self.get_modified_buffer()))]
         splits = [name.split(".") for name in modified if name.startswith(".".join(self._nesting_hierarchy))]
-        names = {".".join(s): ".".join(s[:-1] + ["___" + s[-1]]) if s[-1] in self._methods else ".".join(s)
+        names = {".".join(s): ".".join(s[:-1] + ["___" + s[-1]]) if s[-1] in self._method_names_set else ".".join(s)
                  for s in splits}
         values = {name: self._main_config[name] for name in names}
 
         self.get_setter()(names=names, values=values, processing_type="post", container=self)
+        pre_post_values = self._main_config.get_pre_post_processing_values()
         for name in names:
+            if name in pre_post_values:  # only the value before the first post-processing is kept
+                continue
             try:
                 should_save = values[name] != self._main_config[name]
             except Exception:
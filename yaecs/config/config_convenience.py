@@ -23,7 +23,7 @@ import time
 from copy import deepcopy
 from functools import partial
 from typing import (TYPE_CHECKING,
-                    Any, Callable, Dict, ItemsView, KeysView, List, Optional, Tuple, Type, Union, ValuesView)
+                    Any, Callable, Dict, FrozenSet, ItemsView, KeysView, List, Optional, Tuple, Type, Union, ValuesView)
 
 import yaml
 
@@ -39,6 +39,7 @@ class ConfigConvenienceMixin:
     """ Convenience functions Mixin class for YAECS configurations. """
 
     __getattribute__: Callable[[str], Any]
+    _all_full_paths: Optional[FrozenSet[str]]
     config_metadata: dict
     get: Callable[[str, Any], Any]
     get_dict: Callable[[bool], dict]
@@ -48,6 +49,9 @@ class ConfigConvenienceMixin:
     get_pre_post_processing_values: Callable[[], Dict[str, Any]]
     _get_full_path: Callable[[str], str]
     _get_user_defined_attributes: Callable[[], List[str]]
+    _is_main: bool
+    _main_config: 'Configuration'
+    _method_names_set: FrozenSet[str]
     _methods: List[str]
     _nesting_hierarchy: List[str]
     _protected_attributes: List[str]
@@ -91,14 +95,13 @@ class ConfigConvenienceMixin:
         :return: difference list
         """
 
-        def _investigate_parameter(parameter_name, object_to_check):
+        def _investigate_parameter(parameter_name, parameter_names_to_check):
             """ Get name and values to display. """
             if reduce:
                 name_path = parameter_name.split(".")
                 to_display = name_path.pop(-1)
                 while (len([
-                        param for param in object_to_check.get_parameter_names(deep=True, no_sub_config=True)
-                        if compare_string_pattern(param, "*." + to_display)
+                        param for param in parameter_names_to_check if compare_string_pattern(param, "*." + to_display)
                 ]) != 1 and name_path):
                     to_display = name_path.pop(-1) + "." + to_display
             else:
@@ -122,8 +125,10 @@ class ConfigConvenienceMixin:
 
         differences = []
         self_parameter_names = self.get_parameter_names(deep=True, no_sub_config=True)
+        self_parameter_names_set = set(self_parameter_names)
+        other_parameter_names = other.get_parameter_names(deep=True, no_sub_config=True)
         for name in self_parameter_names:
-            value_in_self, value_in_other, displayed_name = _investigate_parameter(name, self)
+            value_in_self, value_in_other, displayed_name = _investigate_parameter(name, self_parameter_names)
             if value_in_other != value_in_self:
                 if not reduce:
                     differences.append((displayed_name, value_in_other))
@@ -133,9 +138,9 @@ class ConfigConvenienceMixin:
                             differences.append((displayed_name, _get_to_ret(value_in_self, value_in_other)))
                         else:
                             differences.append((displayed_name, value_in_other))
-        for name in other.get_parameter_names(deep=True, no_sub_config=True):
-            _, value_in_other, displayed_name = _investigate_parameter(name, other)
-            if name not in self_parameter_names and value_in_other is not None:
+        for name in other_parameter_names:
+            _, value_in_other, displayed_name = _investigate_parameter(name, other_parameter_names)
+            if name not in self_parameter_names_set and value_in_other is not None:
                 if reduce:
                     if not isinstance(value_in_other, ConfigConvenienceMixin):
                         differences.append((displayed_name, value_in_other))
@@ -204,6 +209,19 @@ class ConfigConvenienceMixin:
             string_to_return += "\n"
         return string_to_return
 
+    def has_parameter(self, full_path: str) -> bool:
+        """
+        Returns whether the main config contains a parameter (or sub-config) with the given full path. The set of full
+        paths is computed once and re-computed only when the structure of the config changes.
+
+        :param full_path: path of the parameter in the main config, using the dot convention
+        :return: True if the parameter exists, False otherwise
+        """
+        main_config = self._main_config
+        if main_config._all_full_paths is None:  # pylint: disable=protected-access
+            object.__setattr__(main_config, "_all_full_paths", frozenset(main_config.get_parameter_names(deep=True)))
+        return full_path in main_config._all_full_paths  # pylint: disable=protected-access
+
     def items(self, deep: bool = False, pre_post_processing_values: bool = False) -> ItemsView:
         """
         Behaves as dict.items(). If deep is False, sub-configs remain sub-configs in the items. Otherwise, they are
@@ -237,7 +255,8 @@ class ConfigConvenienceMixin:
         patterns = (patterns[0] if len(patterns) == 1 and isinstance(patterns[0], list) else patterns)
         if patterns is None or (len(patterns) == 1 and patterns[0] is None):
             return None
-        new_names = [n.strip(" ") for n in patterns if "*" not in n and n.strip(" ") in self.get_parameter_names(True)]
+        new_names = [n.strip(" ") for n in patterns
+                     if "*" not in n and self.has_parameter(self._get_full_path(n.strip(" ")))]
         for name in [n for n in patterns if "*" in n]:
             new_names = new_names + [p for p in self.get_parameter_names(True) if compare_string_pattern(p, name)]
         return new_names
@@ -262,11 +281,10 @@ class ConfigConvenienceMixin:
         file_path, file_extension = os.path.splitext(filename)
         file_extension = file_extension if file_extension else ".yaml"
         config_dump_path = file_path + file_extension
+        pre_post_values = self._main_config.get_pre_post_processing_values()
         to_dump = {
-            a: (getattr(self, "___" + a if a in self._methods else a) if
-                (self._get_full_path(a) not in self._main_config.get_pre_post_processing_values()) else
-                self._main_config.get_pre_post_processing_values()[self._get_full_path(a)]
-                ) if a != "config_metadata" else self._format_metadata()
+            a: (pre_post_values.get(self._get_full_path(a), self[a]) if a != "config_metadata"
+                else self._format_metadata())
             for a in (["config_metadata"] if save_header else []) + self._get_user_defined_attributes()
         }
         with open(config_dump_path, "w", encoding='utf-8') as fil:
@@ -307,10 +325,9 @@ class ConfigConvenienceMixin:
         """
         if not isinstance(first, ConfigConvenienceMixin) or not isinstance(second, ConfigConvenienceMixin):
             return False
-        if first.get_name() != second.get_name():
-            return False
-        nh1, nh2 = first.get_nesting_hierarchy(), second.get_nesting_hierarchy()
-        return len(nh1) == len(nh2) and all(nh1[i] == nh2[i] for i in range(len(nh1)))
+        if first is second:
+            return True
+        return first.get_name() == second.get_name() and first.get_nesting_hierarchy() == second.get_nesting_hierarchy()
 
     def _did_you_mean(self, name: str, filter_type: Optional[type] = None, suffix: str = "") -> str:
         """ Used to propose suggestions when the user tries to access a parameter which does not exist. """
@@ -344,17 +361,15 @@ class ConfigConvenienceMixin:
         """ Used to get a custom YAML dumper capable of writing config tags. """
 
         def config_representer(yaml_dumper, class_instance):
-            # pylint: disable=bad-continuation
+            pre_post_values = self._main_config.get_pre_post_processing_values()
+            hierarchy = class_instance.get_nesting_hierarchy()
             return yaml_dumper.represent_mapping(
                 "tag:yaml.org,2002:map", {
                     a[3:] if a.startswith("___") else a: self._format_metadata() if a == "config_metadata" else
-                    (b if (".".join(class_instance.get_nesting_hierarchy()
-                                    + [a]) not in self._main_config.get_pre_post_processing_values()) else
-                        (self._main_config.get_pre_post_processing_values(
-                        )[".".join(class_instance.get_nesting_hierarchy() + [a])]))
+                    pre_post_values.get(".".join(hierarchy + [a]), b)
                     for (a, b) in class_instance.__dict__.items()
                     if a not in self._protected_attributes
-                    and not (class_instance.get_nesting_hierarchy() and a in ["config_metadata"])
+                    and not (hierarchy and a == "config_metadata")
                 },
             )
 
@@ -370,4 +385,4 @@ class ConfigConvenienceMixin:
 
     def _is_main_config(self) -> bool:
         """ Returns whether the config is the main config. """
-        return not self._nesting_hierarchy
+        return self._is_main
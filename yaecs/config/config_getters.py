@@ -17,7 +17,7 @@ Copyright (C) 2022  Reactive Reality
 """
 
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 from ..yaecs_utils import get_param_as_parsable_string
 
@@ -32,17 +32,24 @@ class ConfigGettersMixin:
     """ Getters Mixin class for YAECS configurations. """
 
     __getattribute__: Callable[[str], Any]
+    _is_main: bool
     _main_config: 'Configuration'
+    _full_name: str
+    _ignored_attributes: FrozenSet[str]
+    _method_names_set: FrozenSet[str]
     _methods: List[str]
     _modified_buffer: List[str]
     _name: str
     _nesting_hierarchy: List[str]
     _operating_creation_or_merging: bool
-    _pre_post_processing_values: Dict[str, Any]
+    _pre_postprocessing_values: Dict[str, Any]
     _protected_attributes: List[str]
     _reference_folder: Optional[str]
     _state: List[str]
+    _structure_version: int
+    _sub_configs_cache: Optional[Tuple[int, List['Configuration']]]
     _sub_configs_list: List['Configuration']
+    _tagged_methods_info: Optional[Dict[str, Dict[str, Any]]]
     _variation_name: str
     _was_last_saved_as: Optional[str]
 
@@ -64,15 +71,21 @@ class ConfigGettersMixin:
 
     def get_sub_configs(self, deep: bool = True) -> List['Configuration']:
         """
-        Returns the list of all sub-configs, including sub-configs of other sub-configs
+        Returns the list of all sub-configs, including sub-configs of other sub-configs. For the main config, the deep
+        list is computed once and re-computed only when the structure of the config changes.
 
         :return: list corresponding to the sub-configs
         """
+        use_cache = deep and self._is_main
+        if use_cache and self._sub_configs_cache is not None and self._sub_configs_cache[0] == self._structure_version:
+            return list(self._sub_configs_cache[1])
         all_sub_configs = []
         for i in self._get_user_defined_attributes():
-            object_to_scan = getattr(self, "___" + i if i in self._methods else i)
+            object_to_scan = getattr(self, "___" + i if i in self._method_names_set else i)
             if isinstance(object_to_scan, ConfigGettersMixin):
                 all_sub_configs += [object_to_scan] + (object_to_scan.get_sub_configs(deep=True) if deep else [])
+        if use_cache:
+            object.__setattr__(self, "_sub_configs_cache", (self._structure_version, list(all_sub_configs)))
         return all_sub_configs
 
     def get_command_line_argument(self, deep: bool = True, do_return_string: bool = False) -> Union[List[str], str]:
@@ -84,17 +97,7 @@ class ConfigGettersMixin:
         :param do_return_string: whether to return a string (True) or a list of strings (False, default)
         :return: list or string containing the parameters
         """
-        to_return = []
-        for param in self.get_parameter_names(deep=deep):
-            if not isinstance(self[param], ConfigGettersMixin):
-                full_name = self._get_full_path(param)
-                value = get_param_as_parsable_string(
-                    self[param] if full_name not in self._main_config.get_pre_post_processing_values() else
-                    self._main_config.get_pre_post_processing_values()[full_name],
-                )
-                to_return.append(f"--{param} {value}")
-
-        return " ".join(to_return) if do_return_string else to_return
+        return " ".join(self._iter_cli_args(deep)) if do_return_string else list(self._iter_cli_args(deep))
 
     def get_dict(self, deep: bool = True, pre_post_processing_values: bool = False) -> dict:
         """
@@ -104,14 +107,21 @@ class ConfigGettersMixin:
         :param pre_post_processing_values: whether to return the values before the post-processing step
         :return: dictionary corresponding to the config
         """
+        pre_post_values = self._main_config.get_pre_post_processing_values() if pre_post_processing_values else None
         to_return = {}
-        for key in self._get_user_defined_attributes():
-            if deep and isinstance(self[key], ConfigGettersMixin):
-                to_return[key] = self[key].get_dict(deep=True, pre_post_processing_values=pre_post_processing_values)
-            else:
-                full_name = self._get_full_path(key)
-                to_return[key] = (self._main_config.get_pre_post_processing_values().get(full_name, self[key])
-                                  if pre_post_processing_values else self[key])
+        stack = [(self, to_return)]
+        while stack:
+            config, config_dict = stack.pop()
+            # pylint: disable=protected-access
+            for key in config._get_user_defined_attributes():
+                value = config[key]
+                if deep and isinstance(value, ConfigGettersMixin):
+                    config_dict[key] = {}
+                    stack.append((value, config_dict[key]))
+                elif pre_post_values is not None:
+                    config_dict[key] = pre_post_values.get(config._get_full_path(key), value)
+                else:
+                    config_dict[key] = value
         return to_return
 
     def get_main_config(self) -> 'Configuration':
@@ -130,9 +140,7 @@ class ConfigGettersMixin:
 
         :return: the buffer of modified elements
         """
-        if self._is_main_config():
-            return self._modified_buffer
-        return self._main_config.get_modified_buffer()
+        return self._modified_buffer if self._is_main else self._main_config.get_modified_buffer()
 
     def get_name(self) -> str:
         """
@@ -142,8 +150,7 @@ class ConfigGettersMixin:
 
         :return: string corresponding to the name
         """
-        variation_suffix = ("_VARIATION_" + self._variation_name if self._variation_name is not None else "")
-        return self._name + variation_suffix
+        return self._full_name
 
     def get_nesting_hierarchy(self) -> List[str]:
         """
@@ -163,11 +170,13 @@ class ConfigGettersMixin:
         :return: the list of the names of all parameters
         """
         complete_list = self._get_user_defined_attributes(no_sub_config=no_sub_config)
-        if deep:
-            order = len(self.get_nesting_hierarchy())
-            for subconfig in self.get_sub_configs(deep=True):
-                complete_list += [".".join(subconfig.get_nesting_hierarchy()[order:] + [param])
-                                  for param in subconfig.get_parameter_names(deep=False, no_sub_config=no_sub_config)]
+        if not deep:
+            return complete_list
+        order = len(self._nesting_hierarchy)
+        for subconfig in self.get_sub_configs(deep=True):
+            prefix = ".".join(subconfig.get_nesting_hierarchy()[order:]) + "."
+            complete_list += [prefix + param
+                              for param in subconfig.get_parameter_names(deep=False, no_sub_config=no_sub_config)]
         return complete_list
 
     def get_pre_post_processing_values(self) -> Dict[str, Any]:
@@ -192,6 +201,9 @@ class ConfigGettersMixin:
             self.
         """
         if full_path:
+            processed_names = self.get_setter().processed_names
+            if processed_names:
+                return processed_names[-1]
             return self._get_full_path(self._get_param_name_from_state())
         return self._get_param_name_from_state()
 
@@ -201,9 +213,7 @@ class ConfigGettersMixin:
 
         :return: the Setter object
         """
-        if self._is_main_config():
-            return self._setter
-        return self._main_config.get_setter()
+        return self._setter if self._is_main else self._main_config.get_setter()
 
     def get_save_file(self) -> Optional[str]:
         """
@@ -237,6 +247,15 @@ class ConfigGettersMixin:
         """
         return self._operating_creation_or_merging
 
+    def _iter_cli_args(self, deep: bool) -> Iterator[str]:
+        """ Yields the command line arguments corresponding to the parameters of the config one by one. """
+        pre_post_values = self._main_config.get_pre_post_processing_values()
+        for param in self.get_parameter_names(deep=deep):
+            value = self[param]
+            if not isinstance(value, ConfigGettersMixin):
+                value = pre_post_values.get(self._get_full_path(param), value)
+                yield f"--{param} {get_param_as_parsable_string(value)}"
+
     def _get_full_path(self, param_name: str) -> str:
         """ Get the full name of given param in the main config """
         return ".".join(self._nesting_hierarchy + [param_name])
@@ -244,7 +263,7 @@ class ConfigGettersMixin:
     def _get_param_name_from_state(self) -> str:
         """ If there is a param processing in the state stack, returns the name of the param. """
         name = None
-        for state in self._state[::-1]:
+        for state in reversed(self._state):
             if state.startswith("processing"):
                 if state.count(";arg0=") > 1:
                     raise ValueError("How did you even manage to raise this ?")
@@ -254,13 +273,16 @@ class ConfigGettersMixin:
             raise RuntimeError("Processing function was called outside a processing phase.")
         return name
 
-    def _get_tagged_methods_info(self) -> List[Tuple[Union[str, Callable]]]:
-        """ Returns a list of info on the methods which were assigned a YAML tag. """
+    def _get_tagged_methods_info(self) -> Dict[str, Dict[str, Any]]:
+        """ Returns a dict of info on the methods which were assigned a YAML tag, indexed by tag. """
+        if self._tagged_methods_info is not None:
+            return self._tagged_methods_info
         to_return = {}
         for method in [getattr(self, name) for name in self._methods]:
             if hasattr(method, "yaecs_metadata"):
                 metadata = getattr(method, "yaecs_metadata")
-                if "tag" in metadata and metadata["tag"] in self._methods and metadata["tag"] != metadata["name"]:
+                if ("tag" in metadata and metadata["tag"] in self._method_names_set
+                        and metadata["tag"] != metadata["name"]):
                     raise ValueError(f"YAML tag '{metadata['tag']}' of method '{metadata['name']}' is ambiguous with "
                                      "the name of another method. Please choose a different tag.")
                 metadata["tag"] = metadata["tag"] if "tag" in metadata else metadata["name"]
@@ -268,13 +290,14 @@ class ConfigGettersMixin:
                     raise ValueError(f"The name of method '{metadata['name']}' is ambiguous with the tag of method "
                                      f"'{to_return[metadata['tag']]['name']}'. Please choose a different tag or name.")
                 to_return[metadata["tag"]] = metadata
+        object.__setattr__(self, "_tagged_methods_info", to_return)
         return to_return
 
     def _get_user_defined_attributes(self, no_sub_config: bool = False) -> List[str]:
         """ Frequently used to get a list of the names of all the parameters that were in the user's config. """
         return [
-            i[3:] if i.startswith("___") else i
-            for i in self.__dict__
-            if (i not in self._protected_attributes + ["config_metadata"]
-                and not (no_sub_config and isinstance(self[i], ConfigGettersMixin)))
+            name[3:] if name.startswith("___") else name
+            for name, value in self.__dict__.items()
+            if (name not in self._ignored_attributes
+                and not (no_sub_config and isinstance(value, ConfigGettersMixin)))
         ]
@@ -18,12 +18,42 @@ Copyright (C) 2022  Reactive Reality
 
 import logging
 import os
-from typing import Any, Callable, List, Optional, Tuple, Union
+import re
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from ..yaecs_utils import (ConfigDeclarator, Hooks, Priority, VariationDeclarator,
-                           assign_order, assign_yaml_tag, hook)
+                           assign_order, assign_yaml_tag, ensure_folder_exists, hook)
 
 YAECS_LOGGER = logging.getLogger(__name__)
+RUN_ID_PATTERN = re.compile(r"(?:^|_)(\d+)\Z")
+TRACKER_REQUIRED_KEYS = {
+    "basic": (),
+    "sacred": ("db_url", "db_name"),
+    "mlflow": ("tracking_uri",),
+    "tensorboard": ("logdir",),
+    "clearml": ("project_name",),
+}
+TRACKER_POSSIBLE_KEYS = frozenset([key for keys in TRACKER_REQUIRED_KEYS.values() for key in keys]
+                                  + ["basic_logdir", "sub_loggers", "type"])
+
+
+def get_max_run_id(folder: str, experiment: str) -> int:
+    """
+    Returns the highest run index among the runs of given experiment in given folder, or -1 if there is none. The folder
+    is scanned on every call : a cached value could hand out the index of a run that already exists.
+
+    :param folder: folder containing the runs
+    :param experiment: name of the experiment, which is the prefix of the name of its runs
+    :return: the highest run index
+    """
+    max_run_id = -1
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name.startswith(experiment):
+                match = RUN_ID_PATTERN.search(entry.name)
+                if match is not None:
+                    max_run_id = max(max_run_id, int(match.group(1)))
+    return max_run_id
 
 
 class ConfigHooksMixin:
@@ -36,9 +66,10 @@ class ConfigHooksMixin:
     get_processed_param_name: Callable[[bool], str]
     get_variation_name: Callable[[], str]
     init_from_config: Callable[[ConfigDeclarator], None]
-    _configuration_variations: List[Tuple[str, List[ConfigDeclarator]]]
-    _configuration_variations_names: List[Tuple[str, List[str]]]
+    _configuration_variations: Dict[str, List[ConfigDeclarator]]
+    _configuration_variations_names: Dict[str, List[str]]
     _grids: List[List[str]]
+    _hooks: Dict[str, Dict[str, None]]
     _nesting_hierarchy: List[str]
 
     def __init__(self, *args, **kwargs):
@@ -52,11 +83,8 @@ class ConfigHooksMixin:
 
         :param hook_name: name of the hook to add.
         """
-        parameter = self.get_processed_param_name(full_path=True)
-        if hook_name not in self.get_hook():
-            self._hooks[hook_name] = []
-        if parameter not in self._hooks[hook_name]:
-            self._hooks[hook_name].append(parameter)
+        # dicts are used as ordered sets of parameter names
+        self._hooks.setdefault(hook_name, {})[self.get_processed_param_name(full_path=True)] = None
 
     def get_experiment_path(self) -> str:
         """
@@ -66,14 +94,14 @@ class ConfigHooksMixin:
         :raises RuntimeError: when more than one experiment path has been registered in the config
         :return: experiment path
         """
-        path = self.get_hook("experiment_path")
+        path = self._hooks.get("experiment_path", {})
         if not path:
             raise RuntimeError("No experiment path was registered. Please use self.register_as_experiment_path as a "
                                "post-processing on a parameter.")
         if len(path) > 1:
             raise RuntimeError("The self.register_as_experiment_path post-processing was used on more than one "
-                               f"parameter : {path}.")
-        return self[path[0]]
+                               f"parameter : {list(path)}.")
+        return self[next(iter(path))]
 
     def get_hook(self, hook_name: Optional[str] = None) -> Hooks:
         """
@@ -83,8 +111,8 @@ class ConfigHooksMixin:
         :return: list of hooked parameter names
         """
         if hook_name is None:
-            return self._hooks
-        return self._hooks[hook_name] if hook_name in self._hooks else []
+            return {name: list(parameters) for name, parameters in self._hooks.items()}
+        return list(self._hooks.get(hook_name, ()))
 
     @hook("additional_config_file")
     @assign_order(Priority.OFTEN_LAST)  # processing this param after this function makes it unclear which file was used
@@ -132,15 +160,12 @@ class ConfigHooksMixin:
 
         def _add_to_variations(variations, names=None):
             if variations:
-                for index, variation in enumerate(self._configuration_variations):
-                    if variation[0] == name:
-                        self._configuration_variations.pop(index)
-                        break
-                self._configuration_variations.append((name, variations))
-                if names is None:
-                    self._configuration_variations_names.append((name, [str(i) for i in list(range(len(variations)))],))
-                else:
-                    self._configuration_variations_names.append((name, names))
+                # popping first moves re-registered variations to the end, as if they were registered for the first time
+                self._configuration_variations.pop(name, None)
+                self._configuration_variations_names.pop(name, None)
+                self._configuration_variations[name] = variations
+                self._configuration_variations_names[name] = ([str(i) for i in range(len(variations))]
+                                                              if names is None else names)
 
         if self._nesting_hierarchy:
             raise RuntimeError(f"Variations declared in sub-configs are invalid ({name}).\n"
@@ -179,21 +204,16 @@ class ConfigHooksMixin:
         folder, experiment = (os.path.dirname(path), os.path.basename(path))
         if not folder:
             folder = "."
-        os.makedirs(folder, exist_ok=True)
-        experiments = [i for i in os.listdir(folder) if i.startswith(experiment)]
-        run_ids = [-1]
-        for exp_name in experiments:
-            try:
-                run_ids.append(int(exp_name.split("_")[-1]))
-            except ValueError:
-                pass
+        ensure_folder_exists(folder)
+        max_run_id = get_max_run_id(folder, experiment)
         new_folder = not os.getenv('PICKUP') and not os.getenv('NODE_RANK')
-        if self.get_variation_name() is None:
-            path = os.path.join(folder, f"{experiment}_{max(run_ids) + int(new_folder)}")
+        variation_name = self.get_variation_name()
+        if variation_name is None:
+            path = os.path.join(folder, f"{experiment}_{max_run_id + new_folder}")
         else:
-            path = os.path.join(folder, f"{experiment}_{max(run_ids)}", self.get_variation_name())
+            path = os.path.join(folder, f"{experiment}_{max_run_id}", variation_name)
         if new_folder:
-            os.makedirs(path, exist_ok=True)
+            ensure_folder_exists(path)
         return path
 
     @hook("grid")
@@ -257,14 +277,6 @@ class ConfigHooksMixin:
         """
         if os.getenv('NODE_RANK'):  # do not track if in a pytorch-lightning spawned process
             return {"type": []}
-        required_keys = {
-            "basic": [],
-            "sacred": ["db_url", "db_name"],
-            "mlflow": ["tracking_uri"],
-            "tensorboard": ["logdir"],
-            "clearml": ["project_name"],
-        }
-        possible_keys = list(required_keys.values()) + [["basic_logdir", "sub_loggers", "type"]]
         if not isinstance(tracker_config, dict):
             raise ValueError(f"{tracker_config} is not a valid tracker config : it is not a dict.")
         if "type" not in tracker_config:
@@ -273,23 +285,17 @@ class ConfigHooksMixin:
                 isinstance(tracker_config["type"], list) and all(isinstance(i, str) for i in tracker_config["type"])):
             raise ValueError(f"{tracker_config} is not a valid tracker config : 'type' should be None, a string or a"
                              " list of strings.")
-        if isinstance(tracker_config["type"], str):
-            logger_list = [t.strip(" ") for t in tracker_config["type"].split(",")]
-        elif tracker_config["type"] is not None:
-            logger_list = []
-            for string in tracker_config["type"]:
-                logger_list += [t.strip(" ") for t in string.split(",")]
-        else:
-            logger_list = []
-        if any(tracker not in required_keys for tracker in logger_list):
+        types = [tracker_config["type"]] if isinstance(tracker_config["type"], str) else tracker_config["type"] or []
+        logger_list = [t.strip(" ") for string in types for t in string.split(",")]
+        if not TRACKER_REQUIRED_KEYS.keys() >= set(logger_list):
             raise ValueError(f"Unknown logger among {logger_list}. "
-                             f"Accepted values are {list(required_keys.keys())}.")
+                             f"Accepted values are {list(TRACKER_REQUIRED_KEYS.keys())}.")
         for logger in logger_list:
-            for key in required_keys[logger]:
+            for key in TRACKER_REQUIRED_KEYS[logger]:
                 if key not in tracker_config:
                     raise ValueError(f"Missing key in {logger}-type tracker config : '{key}'.")
         for key in tracker_config:
-            if not any(key in key_list for key_list in possible_keys):
+            if key not in TRACKER_POSSIBLE_KEYS:
                 YAECS_LOGGER.warning(f"WARNING : Unknown key '{key}' in tracker config. It might be ignored.")
         tracker_config["type"] = logger_list
         return tracker_config
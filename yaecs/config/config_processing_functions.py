@@ -2,10 +2,9 @@
 
 import logging
 import os
-from functools import partial
-from typing import TYPE_CHECKING, Any, Callable, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
-from ..yaecs_utils import Priority, assign_order, assign_yaml_tag, set_function_attribute
+from ..yaecs_utils import Priority, assign_order, assign_yaml_tag, ensure_folder_exists
 
 if TYPE_CHECKING:
     from numbers import Number
@@ -15,6 +14,48 @@ if TYPE_CHECKING:
 YAECS_LOGGER = logging.getLogger(__name__)
 
 
+def match_params_with_cache(main: 'Configuration', pattern: str, matches: Dict[str, Tuple[int, List[str]]]
+                            ) -> List[str]:
+    """
+    Returns main.match_params(pattern), re-using the result stored in matches as long as the structure of the main
+    config did not change since it was computed. Used by processing functions which match the same patterns every time
+    they are called.
+
+    :param main: main config in which to match the pattern
+    :param pattern: pattern to match
+    :param matches: cache of the processing function, mapping patterns to the structure version and the matched params
+    :return: the matched params
+    """
+    version = main._structure_version  # pylint: disable=protected-access
+    if pattern not in matches or matches[pattern][0] != version:
+        matches[pattern] = (version, main.match_params(pattern))
+    return matches[pattern][1]
+
+
+class BoundProcessingFunction:
+    """ Processing function whose arguments after the processed param are bound in advance. It is called with the
+    param only, like a partial, but binds its arguments positionally, which is cheaper on every call than a partial
+    binding them as keywords. Like a partial, its bound arguments are copied when the config is deep-copied. """
+    __slots__ = ("function", "args", "__name__", "yaecs_metadata")
+
+    def __init__(self, function: Callable, *args: Any, name: str, metadata: Dict[str, Any]):
+        """
+        Initializes the BoundProcessingFunction object.
+
+        :param function: function to call, taking the processed param followed by args
+        :param args: arguments to pass to the function after the processed param
+        :param name: name of the processing function
+        :param metadata: yaecs metadata of the processing function
+        """
+        self.function = function
+        self.args = args
+        self.__name__ = name
+        self.yaecs_metadata = metadata
+
+    def __call__(self, param: Any) -> Any:
+        return self.function(param, *self.args)
+
+
 class ConfigProcessingFunctionsMixin:
     """ Pre- and Post-processing functions Mixin class for YAECS configurations. """
 
@@ -37,26 +78,21 @@ class ConfigProcessingFunctionsMixin:
         :return: checking function
         """
 
-        def _check(param: Any, choices: List[Any], config: 'Configuration') -> Any:
+        def _check(param: Any, choices: List[Any], lowered_choices: FrozenSet[Any], config: 'Configuration') -> Any:
             if param is None:
                 return param
-            if param.lower() not in choices:
-                possibilities = ""
-                for index, choice in range(len(choices)):
-                    possibilities += f"'{choice}'"
-                    if index != len(choices) - 1:
-                        possibilities += ", "
+            if (param.lower() if isinstance(param, str) else param) not in lowered_choices:
+                possibilities = ", ".join(f"'{choice}'" for choice in choices)
                 param_name = config.get_processed_param_name(full_path=True)
-                raise ValueError(f"Invalid value for param '{param_name}': '{param}'."
-                                 "Valid choices are [{possibilities}].")
+                raise ValueError(f"Invalid value for param '{param_name}': '{param}'. "
+                                 f"Valid choices are [{possibilities}].")
             return param
 
-        return_function = partial(_check, choices=list_of_choices, config=self)
-        set_function_attribute(return_function, "__name__", "check_param_in_list")
-        set_function_attribute(return_function, "yaecs_metadata", {"name": "check_param_in_list",
-                                                                   "processing_type": "pre",
-                                                                   "order": Priority.OFTEN_FIRST})
-        return return_function
+        lowered_choices = frozenset(c.lower() if isinstance(c, str) else c for c in list_of_choices)
+        return BoundProcessingFunction(_check, list_of_choices, lowered_choices, self, name="check_param_in_list",
+                                       metadata={"name": "check_param_in_list",
+                                                 "processing_type": "pre",
+                                                 "order": Priority.OFTEN_FIRST})
 
     @assign_order(Priority.ALWAYS_LAST)  # there would most likely not be any other processing for this param
     @assign_yaml_tag("copy_param", "pre", "str")
@@ -73,8 +109,8 @@ class ConfigProcessingFunctionsMixin:
         :return: path_to_copy
         """
 
-        def _copy(param: str, main: 'Configuration') -> Any:
-            params = main.match_params(param)
+        def _copy(param: str, main: 'Configuration', matches: Dict[str, Tuple[int, List[str]]]) -> Any:
+            params = match_params_with_cache(main, param, matches)
             if len(params) == 1:
                 return main[params[0]]
             if len(params) > 1:
@@ -87,12 +123,10 @@ class ConfigProcessingFunctionsMixin:
                             f"the copied param. Current default value '{path_to_copy}' is not a string.")
         main = self.get_main_config()
         param_name = self.get_processed_param_name(full_path=True)
-        copy_fn = partial(_copy, main=main)
-        set_function_attribute(copy_fn, "__name__", "_copy")
-        set_function_attribute(copy_fn, "yaecs_metadata", {"name": "_copy",
-                                                           "processing_type": "post",
-                                                           "input_type": "str",
-                                                           "order": Priority.OFTEN_LAST})
+        copy_fn = BoundProcessingFunction(_copy, main, {}, name="_copy", metadata={"name": "_copy",
+                                                                                   "processing_type": "post",
+                                                                                   "input_type": "str",
+                                                                                   "order": Priority.OFTEN_LAST})
 
         main.add_processing_function(param_name=param_name, function_to_add=copy_fn, processing_type="post",
                                      source="copy_param", no_duplicates=True)
@@ -119,13 +153,11 @@ class ConfigProcessingFunctionsMixin:
                 raise ValueError(f"Invalid value for param '{param_name}': '{param}'. "
                                  f"Must be in range [{minimum_} ; {maximum_}].")
             return param
-        return_function = partial(_check, minimum_=minimum, maximum_=maximum, config=self)
-        set_function_attribute(return_function, "__name__", "check_number_in_range")
-        set_function_attribute(return_function, "yaecs_metadata", {"name": "check_number_in_range",
-                                                                   "processing_type": "pre",
-                                                                   "input_type": "(int,float,None)",
-                                                                   "order": Priority.OFTEN_FIRST})
-        return return_function
+        return BoundProcessingFunction(_check, minimum, maximum, self, name="check_number_in_range",
+                                       metadata={"name": "check_number_in_range",
+                                                 "processing_type": "pre",
+                                                 "input_type": "(int,float,None)",
+                                                 "order": Priority.OFTEN_FIRST})
 
     @assign_order(Priority.ALWAYS_LAST)  # there can never be any subsequent processing for this param
     @assign_yaml_tag("protected", "pre", "Any")
@@ -163,7 +195,7 @@ class ConfigProcessingFunctionsMixin:
         """
         experiment_path = self.get_main_config().get_experiment_path()
         path = os.path.join(experiment_path, folder).rstrip(os.path.sep)
-        os.makedirs(path, exist_ok=True)
+        ensure_folder_exists(path)
         return path
 
     def folder_in_experiment_if(self, condition_list: List[tuple] = None) -> Callable:
@@ -185,13 +217,18 @@ class ConfigProcessingFunctionsMixin:
         :return: checking function
         """
 
-        def _folder_in_experiment(folder: str, config: 'Configuration', conditions: list) -> str:
+        def _folder_in_experiment(folder: str, config: 'Configuration', matches: Dict[str, Tuple[int, List[str]]],
+                                  conditions: Tuple[Tuple[str, ...], Tuple[Any, ...], Tuple[Optional[Callable], ...]]
+                                  ) -> str:
+            patterns, expected_values, conversions = conditions
             experiment_path = config.get_experiment_path()
             path = os.path.join(experiment_path, folder).rstrip(os.path.sep)
-            conditions = {str(nb): [c for c in conditions if len(c) == nb] for nb in [2, 3]}
-            if (all(all(c[2](config[i]) == c[1] for i in config.match_params(c[0])) for c in conditions["3"])
-                    and all(all(config[i] == c[1] for i in config.match_params(c[0])) for c in conditions["2"])):
-                os.makedirs(path, exist_ok=True)
+            for pattern, expected_value, conversion in zip(patterns, expected_values, conversions):
+                for name in match_params_with_cache(config, pattern, matches):
+                    value = config[name] if conversion is None else conversion(config[name])
+                    if value != expected_value:
+                        return path
+            ensure_folder_exists(path)
             return path
 
         if condition_list is None:
@@ -205,10 +242,14 @@ class ConfigProcessingFunctionsMixin:
         if not all(len(c) == 2 or len(c) == 3 for c in condition_list):
             raise ValueError("All elements of argument 'condition_list' of function 'folder_in_experiment' should have "
                              "2 elements (param and value) or 3 elements (param, value and conversion).")
-        return_function = partial(_folder_in_experiment, config=self.get_main_config(), conditions=condition_list)
-        set_function_attribute(return_function, "__name__", "folder_in_experiment_if")
-        set_function_attribute(return_function, "yaecs_metadata", {"name": "folder_in_experiment_if",
-                                                                   "processing_type": "post",
-                                                                   "input_type": "str",
-                                                                   "order": Priority.OFTEN_LAST})
-        return return_function
+        # conditions with a conversion function are checked first
+        conditions = [c for c in condition_list if len(c) == 3] + [c for c in condition_list if len(c) == 2]
+        return BoundProcessingFunction(_folder_in_experiment, self.get_main_config(), {},
+                                       (tuple(c[0] for c in conditions),
+                                        tuple(c[1] for c in conditions),
+                                        tuple(c[2] if len(c) == 3 else None for c in conditions)),
+                                       name="folder_in_experiment_if",
+                                       metadata={"name": "folder_in_experiment_if",
+                                                 "processing_type": "post",
+                                                 "input_type": "str",
+                                                 "order": Priority.OFTEN_LAST})
@@ -28,6 +28,7 @@ class ConfigSettersMixin:
     """ Setters Mixin class for YAECS configurations. """
 
     _main_config: 'Configuration'
+    _name: str
     _pre_postprocessing_values: Dict[str, Any]
     _sub_configs_list: List['Configuration']
 
@@ -56,8 +57,7 @@ class ConfigSettersMixin:
 
         :param name: name of the parameter using the dot convention
         """
-        if name in self._pre_postprocessing_values:
-            del self._pre_postprocessing_values[name]
+        self._pre_postprocessing_values.pop(name, None)
 
     def save_value_before_postprocessing(self, name: str, value: Any) -> None:
         """
@@ -66,8 +66,7 @@ class ConfigSettersMixin:
         :param name: name of the parameter using the dot convention
         :param value: value of the parameter before post-processing
         """
-        if name not in self._pre_postprocessing_values:
-            self._pre_postprocessing_values[name] = value
+        self._pre_postprocessing_values.setdefault(name, value)
 
     def set_variation_name(self, value: Optional[str]) -> None:
         """
@@ -76,6 +75,12 @@ class ConfigSettersMixin:
 
         :param value: value of the new variation name
         """
-        object.__setattr__(self._main_config, "_variation_name", value)
-        for subconfig in self._main_config.get_sub_configs(deep=True):
-            object.__setattr__(subconfig, "_variation_name", value)
+        suffix = "" if value is None else "_VARIATION_" + value
+        for config in [self._main_config] + self._main_config.get_sub_configs(deep=True):
+            object.__setattr__(config, "_variation_name", value)
+            object.__setattr__(config, "_full_name", config._name + suffix)  # pylint: disable=protected-access
+
+    def _set_variation_name_attribute(self, value: Optional[str]) -> None:
+        """ Sets the variation name of this config only, along with the full name it is part of. """
+        object.__setattr__(self, "_variation_name", value)
+        object.__setattr__(self, "_full_name", self._name + ("_VARIATION_" + value if value is not None else ""))
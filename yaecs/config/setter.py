@@ -4,14 +4,28 @@ a method container should be passed to resolve those methods. """
 from collections.abc import Iterable
 import logging
 from numbers import Real
-from typing import Any, Callable, Dict, List, Optional, Union
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from ..yaecs_utils import (Priority, ProcessingFunction, ProcessingFunctions, ProcessingOrder, TypeHint, UpdateState,
-                           check_type, compare_string_pattern, is_type_valid, parse_type)
+                           check_type, get_string_pattern_matcher, is_type_valid, parse_type)
 
 YAECS_LOGGER = logging.getLogger("yaecs")
 
 
+def has_attribute(container: object, name: str) -> bool:
+    """
+    Checks whether name is in dir(container), without building and sorting the list of all the attributes of the
+    container and without triggering its __getattribute__ for a missing name. Only valid for objects which do not
+    override __dir__.
+
+    :param container: object to look the attribute up in
+    :param name: name of the attribute
+    :return: whether the attribute is defined on the object or on one of its classes
+    """
+    return name in getattr(container, "__dict__", {}) or any(name in vars(cls) for cls in type(container).__mro__)
+
+
 class Setter:
     """ Processes parameters to set them in a container. Handles type checking based on type hints, pre-processing, and
     post-processing. Can store functions and strings referring to methods, in which case a method container should be
@@ -29,13 +43,27 @@ class Setter:
         :param verbose: whether to print verbose messages
         """
         self.registered_methods: dict = registered_methods
+        self.registered_names: Optional[Dict[str, dict]] = None
         self.default_order: ProcessingOrder = default_order
         self.verbose: bool = verbose
         self.processes: List[str] = ([] if do_not_pre_process else ["pre"]) + ([] if do_not_post_process else ["post"])
+        self.processed_names: List[str] = []
         self.processors: Dict[str, List['Processor']] = {
             "pre": [],
             "post": [],
         }
+        self.processor_sets: Dict[str, Set['Processor']] = {
+            "pre": set(),
+            "post": set(),
+        }
+        self.literal_processors: Dict[str, Dict[str, List['Processor']]] = {
+            "pre": {},
+            "post": {},
+        }
+        self.wildcard_processors: Dict[str, List['Processor']] = {
+            "pre": [],
+            "post": [],
+        }
 
     def __call__(self, names: Dict[str, str], values: Dict[str, Any], processing_type: str, container: object) -> None:
         """
@@ -50,30 +78,34 @@ class Setter:
             raise ValueError(f"Unknown processing_type : '{processing_type}'. "
                              f"Valid types are {list(self.processors.keys())}.")
 
-        processed = []
+        processed: Dict[str, None] = {}  # used as an ordered set
+        sub_containers: Dict[str, object] = {}
         if processing_type in self.processes:
-            processors = [processor for processor in self.processors[processing_type] if processor.applies(values)]
-            processors.sort(key=lambda processor: processor.order)
+            processors = self._get_applying_processors(values, processing_type)
             processors = self._resolve_type_hints(processors)
 
             processed_values = dict(values)
             for processor in processors:
                 for name, value in processed_values.items():
                     with UpdateState(f"processing;{container.get_name()};arg0={name.split('.')[-1]}", container):
-                        processed_values[name] = processor(name, value, container=container)
-                    self._set_value(names[name], processed_values[name], container)
-                    if name not in processed:
-                        processed.append(name)
+                        self.processed_names.append(name)
+                        try:
+                            processed_values[name] = processor(name, value, container=container)
+                        finally:
+                            self.processed_names.pop()
+                    self._set_value(names[name], processed_values[name], container, sub_containers)
+                    processed[name] = None
 
         for name, value in values.items():
             if name not in processed:
-                self._set_value(names[name], value, container)
+                self._set_value(names[name], value, container, sub_containers)
 
         if processing_type == "post" and processed and self.verbose:
-            YAECS_LOGGER.info(f"Performed post-processing for modified parameters {processed}.")
+            YAECS_LOGGER.info(f"Performed post-processing for modified parameters {list(processed)}.")
         if processing_type == "pre":
+            config_class = container.__class__
             for name, value in values.items():
-                if not is_type_valid(values[name], container.__class__):
+                if not is_type_valid(value, config_class):
                     raise RuntimeError(f"ERROR while pre-processing param '{name}' : pre-processing functions that "
                                        "change the type of a param to a non-native YAML type are forbidden because "
                                        "they cannot be saved. Please use a parameter post-processing instead.")
@@ -94,8 +126,8 @@ class Setter:
             is_type_check=True,
             source=source,
         )
-        if not no_duplicates or new_processor not in self.processors["pre"]:
-            self.processors["pre"].append(new_processor)
+        if not no_duplicates or new_processor not in self.processor_sets["pre"]:
+            self._append_processor(new_processor, "pre")
 
     def add_processor(self, processor: ProcessingFunctions, pattern: str, processing_type: Optional[str] = None,
                       order: Optional[ProcessingOrder] = None, source: Optional[str] = None,
@@ -116,15 +148,10 @@ class Setter:
         if isinstance(processor, str):
             if processor in self.registered_methods:
                 metadata = self.registered_methods[processor]
-            elif container is not None and processor in dir(container):
-                candidate = getattr(container, processor)
-                if hasattr(candidate, "yaecs_metadata"):
-                    metadata = candidate.yaecs_metadata
+            elif container is not None and has_attribute(container, processor):
+                metadata = getattr(getattr(container, processor), "yaecs_metadata", None)
             else:
-                for data in self.registered_methods.values():
-                    if "name" in data and data["name"] == processor:
-                        metadata = data
-                        break
+                metadata = self._get_registered_method_by_name(processor)
         else:
             metadata = getattr(processor, "yaecs_metadata", None)
 
@@ -138,18 +165,15 @@ class Setter:
 
         # If the processor is a method of the container, store it as a string
         if container is not None and isinstance(processor, Callable):
-            if hasattr(processor, "yaecs_metadata"):
-                name = processor.yaecs_metadata.get("name", getattr(processor, "__name__", "unknown_function"))
-            else:
-                name = getattr(processor, "__name__", "unknown_function")
-            if name in dir(container):
+            processor_metadata = getattr(processor, "yaecs_metadata", {})
+            name = processor_metadata.get("name", getattr(processor, "__name__", "unknown_function"))
+            if has_attribute(container, name):
                 candidate = getattr(container, name)
-                processor_metadata = getattr(processor, "yaecs_metadata", {})
-                candidate_metadata = getattr(candidate, "yaecs_metadata", {})
-                if isinstance(candidate, Callable) and processor_metadata == candidate_metadata:
+                if isinstance(candidate, Callable) and processor_metadata == getattr(candidate, "yaecs_metadata", {}):
                     processor = name
                     processor_metadata["name"] = name
                     self.registered_methods[name] = processor_metadata
+                    self.registered_names = None
                     metadata = processor_metadata
 
         # Create the new processor
@@ -164,16 +188,15 @@ class Setter:
         )
 
         # Add the new processor
-        if not no_duplicates or new_processor not in self.processors[processing_type]:
-            self.processors[processing_type].append(new_processor)
+        if not no_duplicates or new_processor not in self.processor_sets[processing_type]:
+            self._append_processor(new_processor, processing_type)
             if metadata and "input_type" in metadata:
                 self.add_type_hint(metadata["input_type"], pattern, source=f"method[{processor}]")
-            if new_processor.metadata is not None and "processing_type" in new_processor.metadata:
-                advised_type = new_processor.metadata["processing_type"]
-                if advised_type != processing_type:
-                    YAECS_LOGGER.warning(f"WARNING : processor '{new_processor.name}' is recommended to use as "
-                                         f"{advised_type}-processing function, but was declared as "
-                                         f"{processing_type}-processing function.")
+            advised_type = new_processor.metadata.get("processing_type")
+            if advised_type is not None and advised_type != processing_type:
+                YAECS_LOGGER.warning(f"WARNING : processor '{new_processor.name}' is recommended to use as "
+                                     f"{advised_type}-processing function, but was declared as "
+                                     f"{processing_type}-processing function.")
 
     def bulk_add_type_hints(self, type_hints: Dict[str, str], source: Optional[str] = None,
                             no_duplicates: bool = False) -> None:
@@ -247,6 +270,53 @@ class Setter:
         """
         self._set_processing(value, "pre")
 
+    def _append_processor(self, processor: 'Processor', processing_type: str) -> None:
+        """
+        Appends a processor to the processors of given processing type, and indexes it by pattern.
+
+        :param processor: processor to append
+        :param processing_type: type of processing to append the processor to
+        """
+        processor.rank = len(self.processors[processing_type])
+        self.processors[processing_type].append(processor)
+        self.processor_sets[processing_type].add(processor)
+        if processor.literal_pattern is None:
+            self.wildcard_processors[processing_type].append(processor)
+        else:
+            self.literal_processors[processing_type].setdefault(processor.literal_pattern, []).append(processor)
+
+    def _get_registered_method_by_name(self, name: str) -> Optional[dict]:
+        """
+        Gets the metadata of the first registered method with given name. The index of registered methods by name is
+        built on first use and rebuilt after new methods are registered.
+
+        :param name: name of the method
+        :return: metadata of the method, or None if no registered method has this name
+        """
+        if self.registered_names is None:
+            self.registered_names = {}
+            for data in self.registered_methods.values():
+                if "name" in data:
+                    self.registered_names.setdefault(data["name"], data)
+        return self.registered_names.get(name)
+
+    def _get_applying_processors(self, values: Dict[str, Any], processing_type: str) -> List['Processor']:
+        """
+        Gets the processors of given processing type which apply to at least one of the values. Processors with a
+        literal pattern are looked up by name, so only the ones with a wildcard pattern need to be matched.
+
+        :param values: values to process with names as keys
+        :param processing_type: type of processing to get the processors of
+        :return: applying processors, sorted by order then by insertion
+        """
+        literal_processors = self.literal_processors[processing_type]
+        processors = [processor for processor in self.wildcard_processors[processing_type]
+                      if processor.applies(values)]
+        for name in values:
+            processors += literal_processors.get(name, [])
+        processors.sort(key=attrgetter("order", "rank"))
+        return processors
+
     def _set_processing(self, value: bool, processing_type: str):
         """
         Sets whether to process for a given processing type.
@@ -259,18 +329,25 @@ class Setter:
         elif not value and processing_type in self.processes:
             self.processes.remove(processing_type)
 
-    def _set_value(self, name, value, container) -> None:
+    def _set_value(self, name, value, container, sub_containers: Optional[Dict[str, object]] = None) -> None:
         """
         Sets the value of a parameter.
 
         :param name: name of the parameter
         :param value: value to set
         :param container: object containing the parameter
+        :param sub_containers: if provided, cache of the sub-containers already looked up in the main config
         """
-        sub_container = ".".join(name.split(".")[:-1])
-        param_name = name.split(".")[-1]
-        object.__setattr__((container.get_main_config()[sub_container] if sub_container else container),
-                           param_name, value)
+        sub_container, _, param_name = name.rpartition(".")
+        if not sub_container:
+            target = container
+        elif sub_containers is not None and sub_container in sub_containers:
+            target = sub_containers[sub_container]
+        else:
+            target = container.get_main_config()[sub_container]
+            if sub_containers is not None:
+                sub_containers[sub_container] = target
+        object.__setattr__(target, param_name, value)
 
     def _resolve_type_hints(self, processors: List['Processor']) -> List['Processor']:
         """
@@ -314,6 +391,8 @@ class Processor:
         :param metadata: dictionary of metadata about the processor
         """
         self.pattern: str = pattern
+        self.pattern_matcher: Callable[[str], bool] = get_string_pattern_matcher(pattern)
+        self.literal_pattern: Optional[str] = None if "*" in pattern else pattern.strip(" ")
         self.is_type_check: bool = is_type_check
         self.source: Optional[str] = source
         self.metadata: dict = {} if metadata is None else metadata
@@ -322,6 +401,8 @@ class Processor:
         self.name = self._resolve_name(processor)
         self.processor: Union[ProcessingFunction, TypeHint] = parse_type(processor) if self.is_type_check else processor
         self.order: ProcessingOrder = self._resolve_order(order, default_order)
+        self.key: Tuple[Any, ...] = (self.pattern, self.name, self.order, self.source)
+        self.rank: int = 0
 
     def __call__(self, name: str, old_value: Any, container: Optional[object] = None) -> Any:
         """
@@ -348,8 +429,15 @@ class Processor:
         :param other: processor to compare
         :return: whether the processors are equal
         """
-        return (self.pattern == other.pattern and self.name == other.name and self.order == other.order
-                and self.source == other.source)
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        """
+        Hashes the processor consistently with its equality.
+
+        :return: hash of the processor
+        """
+        return hash(self.key)
 
     def applies(self, params_or_param_name: Union[Dict[str, Any], str]) -> bool:
         """
@@ -359,8 +447,10 @@ class Processor:
         :return: whether the processor applies
         """
         if isinstance(params_or_param_name, str):
-            return compare_string_pattern(params_or_param_name, self.pattern)
-        return any(compare_string_pattern(name, self.pattern) for name in params_or_param_name.keys())
+            return self.pattern_matcher(params_or_param_name)
+        if self.literal_pattern is not None:
+            return self.literal_pattern in params_or_param_name
+        return any(map(self.pattern_matcher, params_or_param_name.keys()))
 
     def _resolve(self, container: object, name: str) -> Callable:
         """
@@ -372,11 +462,11 @@ class Processor:
         if self.is_type_check:
             return check_type(self.processor, name)
         if isinstance(self.processor, str):
-            if (self.name not in dir(container)
-                    or not isinstance(getattr(container, self.name), Callable)):
+            method = getattr(container, self.name) if has_attribute(container, self.name) else None
+            if not isinstance(method, Callable):
                 source_message = "" if self.source is None else f" (added from {self.source})"
                 raise ValueError(f"Method '{self.name}'{source_message} not found in {container}.")
-            return getattr(container, self.name)
+            return method
         return self.processor
 
     def _resolve_name(self, processor: ProcessingFunction) -> str:
@@ -2,13 +2,16 @@
 
 import logging
 import re
-from typing import Any, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 import yaml
 
 from ..yaecs_utils import parse_type, YAML_EXPRESSIONS
 
 YAECS_LOGGER = logging.getLogger(__name__)
+PARAM_NAME_START_PATTERN = re.compile(r'^[A-Za-z_*]')
+PARAM_NAME_CHARS_PATTERN = re.compile(r'^[A-Za-z0-9._*]*$')
+TYPE_TAG_PREFIX_LENGTH = len("!type:")
 
 
 class YAMLScanner:
@@ -19,6 +22,7 @@ class YAMLScanner:
         self.params: Dict[str, Any] = {}
         self.type_hints: Dict[str, str] = {}
         self.processing_functions: Dict[str, str] = {}
+        self.scalar_constructors: Tuple[Tuple[re.Pattern, Callable], ...] = ()
         self.state: Dict[str, Any] = {
             "currently_processed_path": [],
             "last_non_scalar": 0,
@@ -32,7 +36,7 @@ class YAMLScanner:
         """ Resolve a YAML node to a Python object. """
 
         with NoTag(yaml_loader):
-            if isinstance(node, yaml.ScalarNode):
+            if node.id == "scalar":
                 if node.value == "":
                     def _can_be_str(parsed_type):
                         if parsed_type is str:
@@ -42,15 +46,15 @@ class YAMLScanner:
                                 return True
                             return any(_can_be_str(t) for t in parsed_type)
                         return False
-                    if _can_be_str(parse_type(tag[len("!type:"):])):
+                    if _can_be_str(parse_type(tag[TYPE_TAG_PREFIX_LENGTH:])):
                         return yaml_loader.default_yaml_constructors["tag:yaml.org,2002:str"](yaml_loader, node)
-                for key, value in YAML_EXPRESSIONS.items():
-                    if value.match(node.value):
-                        return yaml_loader.default_yaml_constructors[f"tag:yaml.org,2002:{key}"](yaml_loader, node)
+                for expression, constructor in self.scalar_constructors:
+                    if expression.match(node.value):
+                        return constructor(yaml_loader, node)
                 return yaml_loader.construct_scalar(node)
-            if isinstance(node, yaml.SequenceNode):
+            if node.id == "sequence":
                 return yaml_loader.construct_sequence(node, deep=True)
-            if isinstance(node, yaml.MappingNode):
+            if node.id == "mapping":
                 return yaml_loader.construct_mapping(node, deep=True)
             raise ValueError(f"Unsupported node type {type(node)}.")
 
@@ -60,13 +64,12 @@ class YAMLScanner:
         self.state["is_param_tag"] = bool(yaml_loader.constructed_objects) or tag.lower() == "!:no-tag:"
         self.state["resolving_recursive_param"] = yaml_loader.DEFAULT_MAPPING_TAG == "!:no-tag:"
         complex_added = 0
-        for value in list(yaml_loader.constructed_objects.keys())[::-1]:
+        for value in reversed(yaml_loader.constructed_objects):
             if isinstance(value, (yaml.MappingNode, yaml.SequenceNode)):
                 complex_added += 1
             else:
                 break
-        node_type = "scalar" if isinstance(node, yaml.ScalarNode) else "sequence" if isinstance(
-            node, yaml.SequenceNode) else "mapping"
+        node_type = node.id  # "scalar", "sequence" or "mapping"
 
         if node_type == "sequence":
             self.state["sequence_depth"].append("sequence")
@@ -74,7 +77,7 @@ class YAMLScanner:
             if node_type == "mapping":
                 self.state["sequence_depth"].append("mapping")
             if complex_added and len(yaml_loader.constructed_objects) != self.state["last_ended_mapping"]:
-                self.state["sequence_depth"] = self.state["sequence_depth"][:-complex_added]
+                del self.state["sequence_depth"][-complex_added:]
                 self.state["last_ended_mapping"] = len(yaml_loader.constructed_objects)
         if node_type == "mapping" or complex_added:
             self.state["last_non_scalar"] = len(yaml_loader.constructed_objects)
@@ -91,6 +94,7 @@ class YAMLScanner:
         def generic_constructor(yaml_loader, tag, node):
 
             self.update_state(yaml_loader, tag, node)
+            lower_tag = tag.lower()
 
             if self.state["is_key_node"]:
                 return self.resolve_node(yaml_loader, tag, node)
@@ -99,13 +103,13 @@ class YAMLScanner:
                 if self.state["resolving_recursive_param"]:
                     return self.resolve_node(yaml_loader, tag, node)
 
-                name = yaml_loader.constructed_objects[list(yaml_loader.constructed_objects.keys())[-1]]
+                name = yaml_loader.constructed_objects[next(reversed(yaml_loader.constructed_objects))]
                 check_valid_param_name(name, f"Invalid name '{name}' found in file {self.path} : " + "{issue}.")
                 full_name = ".".join(self.state["currently_processed_path"] + [name])
 
-                if tag.lower() != "!type:config":
-                    if tag.lower().startswith("!type:"):
-                        self.type_hints[full_name] = tag[len("!type:"):]
+                if lower_tag != "!type:config":
+                    if lower_tag.startswith("!type:"):
+                        self.type_hints[full_name] = tag[TYPE_TAG_PREFIX_LENGTH:]
                     elif tag != "!:no-tag:" and not tag.startswith("tag:yaml.org,2002:"):
                         self.processing_functions[full_name] = tag[1:].split(",")
 
@@ -113,7 +117,7 @@ class YAMLScanner:
                     return self.params[full_name]
 
             else:
-                if tag.lower() == "!type:config":
+                if lower_tag == "!type:config":
                     # If root of the YAML file but no provided name > assume dict
                     return yaml_loader.construct_mapping(node, deep=True)
                 # If root of the YAML file and a name is provided > use first part as config name
@@ -129,6 +133,8 @@ class YAMLScanner:
         if not hasattr(loader, "default_yaml_constructors"):
             loader.default_yaml_constructors = dict(loader.yaml_constructors)
             loader.yaml_constructors = {}
+        self.scalar_constructors = tuple((expression, loader.default_yaml_constructors[f"tag:yaml.org,2002:{key}"])
+                                         for key, expression in YAML_EXPRESSIONS.items())
         loader.DEFAULT_MAPPING_TAG = "!type:config"
         loader.DEFAULT_SCALAR_TAG = "!:no-tag:"
         loader.DEFAULT_SEQUENCE_TAG = "!:no-tag:"
@@ -139,15 +145,14 @@ class YAMLScanner:
 
 def check_valid_param_name(name: str, message: Optional[str] = None) -> None:
     """ Raise relevant errors in the input name is not a valid sub-config name. """
+    # checked from the last rule to the first, so that the last broken rule is the one reported
     issue = None
-    if not name:
-        issue = "sub-config names cannot be empty"
-    if not re.match(r'^[A-Za-z_*]', name):
-        issue = "sub-config names must start with a letter or an underscore"
-    if not re.match(r'^[A-Za-z0-9._*]*$', name):
-        issue = "sub-config names can only contain letters, numbers, dots and underscores"
     if name.endswith('.'):
         issue = "sub-config names cannot end with a dot"
+    elif not PARAM_NAME_CHARS_PATTERN.match(name):
+        issue = "sub-config names can only contain letters, numbers, dots and underscores"
+    elif not PARAM_NAME_START_PATTERN.match(name):
+        issue = "sub-config names must start with a letter or an underscore"
     if issue:
         raise ValueError(message.format_map({"issue": issue}))
 
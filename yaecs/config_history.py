@@ -20,8 +20,9 @@ import glob
 import io
 import logging
 import os
-import sys
 import time
+from bisect import bisect_right
+from contextlib import redirect_stdout
 from pathlib import Path
 
 try:
@@ -100,11 +101,9 @@ class ConfigHistory:
         self.configs = []
         for path in self.paths:
             try:
-                sys.stdout = io.StringIO()
-                self.configs.append(config_class.load_config(path))
-                sys.stdout = sys.__stdout__
+                with redirect_stdout(io.StringIO()):
+                    self.configs.append(config_class.load_config(path))
             except Exception:
-                sys.stdout = sys.__stdout__
                 YAECS_LOGGER.error(f"Error while loading config {path}.")
                 raise
         for i, config in enumerate(self.configs):
@@ -116,13 +115,19 @@ class ConfigHistory:
                           f"Analysing differences...")
 
         self.matrix = self.compute_difference_matrix()
-        self.span = self.compute_span()
-        self.similarity_matrix = [[
-            len(
-                self.ignore_for_graphing(list(self.matrix[row][col]), row, col,
-                                         self))
+        self.parameter_suffix_indexes = [
+            self.build_suffix_index(config.get_parameter_names())
+            for config in self.configs
+        ]
+        # ignore_for_graphing can be costly : it is run once per cell and reused for both the span and the similarities
+        self.ignored_matrix = [[
+            self.ignore_for_graphing(list(self.matrix[row][col]), row, col,
+                                     self)
             for col in range(len(self.matrix[row]))
         ] for row in range(len(self.matrix))]
+        self.span = self.compute_span()
+        self.similarity_matrix = [[len(ignored) for ignored in row]
+                                  for row in self.ignored_matrix]
         self.similarity_coefficients = [
             sum(row) for row in self.similarity_matrix
         ]
@@ -137,9 +142,8 @@ class ConfigHistory:
     def compute_span(self):
         """ Computes span of parameter in experiments. """
         span = {}
-        for i, row in enumerate(self.matrix):
-            for j, elem in enumerate(row):
-                ignored = self.ignore_for_graphing(elem, i, j, self)
+        for row in self.ignored_matrix:
+            for ignored in row:
                 for param in ignored:
                     if param[0] not in span:
                         span[param[0]] = [param[1]]
@@ -187,14 +191,28 @@ class ConfigHistory:
                     first, second, labeljust="l",
                     label=self.format_list(self.matrix[first][second]))
 
-        potential_nodes = list(range(len(self.configs)))
-        potential_nodes.sort(key=lambda x: self.modification_times[x])
-        potential_nodes.sort(key=lambda x: self.similarity_coefficients[x])
+        # Candidates stay sorted by (similarity, date) and parents by (similarity, -date) : ties keep insertion order
+        potential_nodes = sorted(range(len(self.configs)),
+                                 key=lambda x: (self.similarity_coefficients[x], self.modification_times[x]))
+        remaining = set(potential_nodes)
         nodes_added = []
+        nodes_by_connectivity = []
+        connectivity_keys = []
+
+        def add_to_connectivity(node):
+            key = (self.similarity_coefficients[node], -self.modification_times[node])
+            position = bisect_right(connectivity_keys, key)
+            connectivity_keys.insert(position, key)
+            nodes_by_connectivity.insert(position, node)
+
+        # Stands in for the similarity to already added nodes so that they are never picked as new nodes
+        row_max = [max(row) + 1 for row in self.similarity_matrix]
         for _ in range(len(potential_nodes)):
             if not nodes_added:
                 index = potential_nodes.pop(0)
+                remaining.discard(index)
                 nodes_added.append(index)
+                add_to_connectivity(index)
                 self.config_graph.add_node(
                     index, style="filled", label=(
                         f"{self.names[index]}\n"
@@ -202,33 +220,23 @@ class ConfigHistory:
                         f"{self.format_metrics(index)}"))
             else:
                 # Find which node to add in priority
-                nodes_by_connectivity = nodes_added.copy()
-                nodes_by_connectivity.sort(
-                    key=lambda x: -self.modification_times[x])
-                nodes_by_connectivity.sort(
-                    key=lambda x: self.similarity_coefficients[x])
-
                 relevant_similarities = [[
-                    (self.similarity_matrix[i][j] if j in potential_nodes else
-                     max(self.similarity_matrix[i]) + 1)
+                    (self.similarity_matrix[i][j] if j in remaining else
+                     row_max[i])
                     for j in range(len(self.similarity_matrix[i]))
                 ] for i in nodes_by_connectivity]
                 best_new_node = [min(i) for i in relevant_similarities]
-                new_parent_node = nodes_by_connectivity[best_new_node.index(
-                    min(best_new_node))]
-                potential_new_nodes = [
-                    i for i in potential_nodes
-                    if (self.similarity_matrix[new_parent_node][i] == min(
-                        best_new_node))
-                ]
-                potential_new_nodes.sort(
-                    key=lambda x: self.modification_times[x])
-                potential_new_nodes.sort(
-                    key=lambda x: self.similarity_coefficients[x])
-                new_node = potential_nodes.pop(
-                    potential_nodes.index(potential_new_nodes[0]))
+                min_best = min(best_new_node)
+                new_parent_node = nodes_by_connectivity[best_new_node.index(min_best)]
+                # potential_nodes is already in priority order, so the first match is the one to add
+                new_node_index = next(
+                    index for index, i in enumerate(potential_nodes)
+                    if self.similarity_matrix[new_parent_node][i] == min_best)
+                new_node = potential_nodes.pop(new_node_index)
+                remaining.discard(new_node)
                 # Add the node
                 nodes_added.append(new_node)
+                add_to_connectivity(new_node)
                 date = time.ctime(self.modification_times[new_node])
                 self.config_graph.add_node(
                     new_node, style="filled",
@@ -244,11 +252,9 @@ class ConfigHistory:
             for i, config in enumerate(self.configs):
                 group = ""
                 for j in self.group_by:
-                    params = config.get_parameter_names()
-                    for param in params:
-                        if param.endswith("." + j) or param == j:
-                            group += (f" ; {j}:{config[param]}"
-                                      if group else f"{j}:{config[param]}")
+                    for param in self.parameter_suffix_indexes[i].get(j, []):
+                        group += (f" ; {j}:{config[param]}"
+                                  if group else f"{j}:{config[param]}")
                 if group and group not in groups:
                     groups[group] = [i]
                 elif group:
@@ -317,18 +323,13 @@ class ConfigHistory:
                 color_scheme = class_scheme
         elif scheme.startswith("param:"):
             values = []
-            for config in self.configs:
-                found = False
-                params = config.get_parameter_names()
-                for param in params:
-                    if param.endswith("." + scheme[6:]) or param == scheme[6:]:
-                        if not found:
-                            values.append(config[param])
-                            found = True
-                        else:
-                            raise RuntimeError(f"Ambiguous param : {scheme[6:]}.")
-                if not found:
+            for config, suffix_index in zip(self.configs, self.parameter_suffix_indexes):
+                matching_params = suffix_index.get(scheme[6:], [])
+                if not matching_params:
                     raise ValueError(f"Unknown param : {scheme[6:]}.")
+                if len(matching_params) > 1:
+                    raise RuntimeError(f"Ambiguous param : {scheme[6:]}.")
+                values.append(config[matching_params[0]])
             indexes_values = list(zip(list(range(len(self.configs))), values))
             for indexes_value in indexes_values:
                 if indexes_value[1] is None:
@@ -520,6 +521,16 @@ class ConfigHistory:
             return file_parent_minus_folder
         return f"{name}:{file_parent_minus_folder}"
 
+    @staticmethod
+    def build_suffix_index(parameter_names):
+        """ Maps every dot-separated suffix of the given parameter names to the list of names ending with it. """
+        suffix_index = {}
+        for name in parameter_names:
+            parts = name.split(".")
+            for start in range(len(parts)):
+                suffix_index.setdefault(".".join(parts[start:]), []).append(name)
+        return suffix_index
+
     @staticmethod
     def format_list(list_to_format):
         """ Formats list for printing """
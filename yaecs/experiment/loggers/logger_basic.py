@@ -6,8 +6,6 @@ import sys
 import traceback
 from typing import Any, Optional, Union
 
-from mock import patch
-
 from .base_logger import Logger
 from .logger_utils import NotImportedModule, add_to_csv, new_print
 
@@ -52,6 +50,8 @@ class BasicLogger(Logger):
         return self.path
 
     def main_function_context(self):
+        # mock pulls in asyncio and unittest, which noticeably slows down 'import yaecs', so only import it when needed
+        from mock import patch  # pylint: disable=import-outside-toplevel
         basic_tracker_context = BasicTrackerContext(self.path,
                                                     self.tracker.experiment.number_of_runs,
                                                     self.tracker.experiment.current_run)